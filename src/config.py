@@ -8,7 +8,8 @@ class Settings:
     redis_host: str = "redis"
     redis_port: int = 6379
     cache_ttl_seconds: int = 3600
-    database_url: str = "sqlite:///./products.db"
+    database_url: str = "sqlite+aiosqlite:///./products.db"
+    seed_on_startup: bool = False
 
     @staticmethod
     def from_env() -> "Settings":
@@ -17,5 +18,6 @@ class Settings:
             redis_host=os.getenv("REDIS_HOST", "redis"),
             redis_port=int(os.getenv("REDIS_PORT", "6379")),
             cache_ttl_seconds=int(os.getenv("CACHE_TTL_SECONDS", "3600")),
-            database_url=os.getenv("DATABASE_URL", "sqlite:///./products.db"),
+            database_url=os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./products.db"),
+            seed_on_startup=os.getenv("SEED_ON_STARTUP", "0") == "1",
         )
@@ -1,7 +1,8 @@
-from collections.abc import Generator
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 Base = declarative_base()
 
@@ -12,20 +13,51 @@ def _sqlite_connect_args(database_url: str) -> dict:
     return {}
 
 
+def _pool_options(database_url: str) -> dict:
+    if database_url.startswith("sqlite"):
+        # Local file/memory connections cannot go stale, so skip pre-ping.
+        if make_url(database_url).database in (None, "", ":memory:"):
+            return {"poolclass": StaticPool}
+        return {}
+    return {"pool_size": 10, "max_overflow": 20, "pool_recycle": 1800, "pool_pre_ping": True}
+
+
+def _set_sqlite_pragma(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 def create_session_factory(database_url: str):
-    engine = create_engine(
+    engine = create_async_engine(
         database_url,
-        future=True,
-        pool_pre_ping=True,
         connect_args=_sqlite_connect_args(database_url),
+        **_pool_options(database_url),
     )
-    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    if database_url.startswith("sqlite"):
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragma)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
     return engine, session_factory
 
 
-def get_db_session(session_factory) -> Generator[Session, None, None]:
-    db = session_factory()
-    try:
-        yield db
-    finally:
-        db.close()
+class DBSessionMiddleware:
+    def __init__(self, app: ASGIApp, session_factory: async_sessionmaker):
+        self.app = app
+        self.session_factory = session_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with self.session_factory() as db:
+            scope.setdefault("state", {})["db"] = db
+            await self.app(scope, receive, send)
+
+
+async def create_tables(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
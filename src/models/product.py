@@ -5,6 +5,10 @@ from src.database import Base
 
 
 class Product(Base):
+    # update_product loads entities with raiseload("*"), and create_product
+    # returns the in-memory instance without a reload: any relationship added
+    # here must be loaded explicitly with selectinload/joinedload instead of
+    # lazily per row.
     __tablename__ = "products"
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True, index=True)
@@ -0,0 +1,19 @@
+import asyncio
+
+from src.config import Settings
+from src.database import create_session_factory, create_tables
+from src.services.product_repository import seed_products
+
+
+async def run_seed(settings: Settings) -> None:
+    engine, session_factory = create_session_factory(settings.database_url)
+    try:
+        await create_tables(engine)
+        async with session_factory() as db:
+            await seed_products(db)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_seed(Settings.from_env()))
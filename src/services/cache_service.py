@@ -1,52 +1,128 @@
-import json
 import logging
 
-import redis
+import msgpack
+from cachetools import TTLCache
+from redis.asyncio import ConnectionPool, Redis
 
 from src.config import Settings
 from src.schemas.product import ProductResponse
 
 logger = logging.getLogger(__name__)
 
+_PACK = msgpack.Packer(use_bin_type=True).pack
+_KEY_PREFIX = b"product:"
+
+REDIS_MAX_CONNECTIONS = 32
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+LOCAL_CACHE_MAX_SIZE = 1024
+LOCAL_CACHE_MAX_TTL_SECONDS = 60
+
+
+def _pack_product(product: ProductResponse) -> bytes:
+    # Fixed five-field shape, so skip the generic pydantic serializer walk.
+    return _PACK(
+        {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "price": product.price,
+            "stock_quantity": product.stock_quantity,
+        }
+    )
+
 
 class ProductCacheService:
-    def __init__(self, settings: Settings, redis_client: redis.Redis | None = None):
+    def __init__(self, settings: Settings, redis_client: Redis | None = None):
         self.settings = settings
-        self._client = redis_client or redis.Redis(
+        self._ttl = int(settings.cache_ttl_seconds)
+        self._client = redis_client or Redis(connection_pool=self._create_pool(settings))
+        # Per-process layer in front of Redis; kept short-lived because other
+        # workers' invalidations only reach it through expiry.
+        self._local: TTLCache[str, ProductResponse] = TTLCache(
+            maxsize=LOCAL_CACHE_MAX_SIZE,
+            ttl=min(LOCAL_CACHE_MAX_TTL_SECONDS, settings.cache_ttl_seconds),
+        )
+
+    @staticmethod
+    def _create_pool(settings: Settings) -> ConnectionPool:
+        return ConnectionPool(
             host=settings.redis_host,
             port=settings.redis_port,
-            decode_responses=True,
+            decode_responses=False,
             socket_timeout=1,
             socket_connect_timeout=1,
+            socket_keepalive=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
         )
 
     @staticmethod
-    def _cache_key(product_id: str) -> str:
-        return f"product:{product_id}"
+    def _decode(cached_payload: bytes | None) -> ProductResponse | None:
+        if not cached_payload:
+            return None
+        data = msgpack.unpackb(cached_payload, raw=False)
+        # Payloads are only ever written from a validated ProductResponse.
+        return ProductResponse.model_construct(**data)
 
-    def get_product_from_cache(self, product_id: str) -> ProductResponse | None:
+    async def get_product_from_cache(self, product_id: str) -> ProductResponse | None:
+        local_product = self._local.get(product_id)
+        if local_product is not None:
+            return local_product
         try:
-            cached_json = self._client.get(self._cache_key(product_id))
-            if not cached_json:
-                return None
-            data = json.loads(cached_json)
-            return ProductResponse(**data)
+            product = self._decode(await self._client.get(_KEY_PREFIX + product_id.encode()))
+            if product is not None:
+                self._local[product_id] = product
+            return product
         except Exception as exc:
             logger.warning("Redis get failed; falling back to DB. reason=%s", exc)
             return None
 
-    def set_product_in_cache(self, product: ProductResponse) -> None:
+    async def get_products_from_cache(self, product_ids: list[str]) -> list[ProductResponse | None]:
+        products = [self._local.get(product_id) for product_id in product_ids]
+        missing_ids = [product_id for product_id, product in zip(product_ids, products) if product is None]
+        if not missing_ids:
+            return products
         try:
-            self._client.set(
-                self._cache_key(product.id),
-                product.model_dump_json(),
-                ex=self.settings.cache_ttl_seconds,
-            )
+            cached_values = await self._client.mget([_KEY_PREFIX + product_id.encode() for product_id in missing_ids])
+        except Exception as exc:
+            logger.warning("Redis mget failed; falling back to DB. reason=%s", exc)
+            return products
+
+        fetched = {}
+        for product_id, cached_payload in zip(missing_ids, cached_values):
+            try:
+                product = self._decode(cached_payload)
+            except Exception as exc:
+                logger.warning("Redis payload decode failed; falling back to DB. reason=%s", exc)
+                continue
+            if product is not None:
+                self._local[product_id] = product
+                fetched[product_id] = product
+        return [
+            product if product is not None else fetched.get(product_id)
+            for product_id, product in zip(product_ids, products)
+        ]
+
+    async def set_product_in_cache(self, product: ProductResponse) -> None:
+        self._local[product.id] = product
+        try:
+            await self._client.setex(_KEY_PREFIX + product.id.encode(), self._ttl, _pack_product(product))
         except Exception as exc:
             logger.warning("Redis set failed; continuing without cache. reason=%s", exc)
 
-    def invalidate_product_cache(self, product_id: str) -> None:
+    async def invalidate_product_cache(self, product_id: str) -> None:
+        self._local.pop(product_id, None)
+        try:
+            await self._client.delete(_KEY_PREFIX + product_id.encode())
+        except Exception as exc:
+            logger.warning("Redis delete failed; continuing. reason=%s", exc)
+
+    async def invalidate_products_cache(self, product_ids: list[str]) -> None:
+        if not product_ids:
+            return
+        for product_id in product_ids:
+            self._local.pop(product_id, None)
         try:
-            self._client.delete(self._cache_key(product_id))
+            await self._client.delete(*(_KEY_PREFIX + product_id.encode() for product_id in product_ids))
         except Exception as exc:
             logger.warning("Redis delete failed; continuing. reason=%s", exc)
@@ -1,13 +1,20 @@
 import uuid
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import RowMapping, delete, exists, select, update
+from sqlalchemy import insert as sa_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.models.product import Product
 from src.schemas.product import ProductCreate, ProductUpdate
 
+_SEED_NAMESPACE = uuid.UUID("5b0f3c9e-2a4d-4f7e-9c61-8d2e7a1b4c30")
+_INSERT_BY_DIALECT = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
 
-def create_product(db: Session, payload: ProductCreate) -> Product:
+
+async def create_product(db: AsyncSession, payload: ProductCreate) -> Product:
     product = Product(
         id=str(uuid.uuid4()),
         name=payload.name,
@@ -16,62 +23,74 @@ def create_product(db: Session, payload: ProductCreate) -> Product:
         stock_quantity=payload.stock_quantity,
     )
     db.add(product)
-    db.commit()
-    db.refresh(product)
+    await db.commit()
     return product
 
 
-def get_product_by_id(db: Session, product_id: str) -> Product | None:
-    return db.get(Product, product_id)
-
-
-def update_product(db: Session, product: Product, payload: ProductUpdate) -> Product:
-    update_values = payload.model_dump(exclude_unset=True)
-    for field_name, value in update_values.items():
-        setattr(product, field_name, value)
-
-    db.add(product)
-    db.commit()
-    db.refresh(product)
+async def get_product_row(db: AsyncSession, product_id: str) -> RowMapping | None:
+    statement = select(
+        Product.id,
+        Product.name,
+        Product.description,
+        Product.price,
+        Product.stock_quantity,
+    ).where(Product.id == product_id)
+    row = (await db.execute(statement)).one_or_none()
+    return row._mapping if row else None
+
+
+async def update_product(db: AsyncSession, product_id: str, payload: ProductUpdate) -> Product | None:
+    statement = (
+        update(Product)
+        .where(Product.id == product_id)
+        .values(**payload.model_dump(exclude_unset=True))
+        .returning(Product)
+        .options(raiseload("*"))
+    )
+    product = (await db.execute(statement)).scalar_one_or_none()
+    await db.commit()
     return product
 
 
-def delete_product(db: Session, product: Product) -> None:
-    db.delete(product)
-    db.commit()
-
+async def delete_product(db: AsyncSession, product_id: str) -> bool:
+    statement = delete(Product).where(Product.id == product_id).returning(Product.id)
+    deleted_id = (await db.execute(statement)).scalar_one_or_none()
+    await db.commit()
+    return deleted_id is not None
 
-def count_products(db: Session) -> int:
-    return len(db.execute(select(Product.id)).all())
 
-
-def seed_products(db: Session) -> None:
-    if count_products(db) > 0:
+async def seed_products(db: AsyncSession) -> None:
+    if await db.scalar(select(exists().select_from(Product))):
         return
 
     sample_products = [
-        Product(
-            id=str(uuid.uuid4()),
-            name="Wireless Mouse",
-            description="Ergonomic 2.4GHz wireless mouse",
-            price=24.99,
-            stock_quantity=120,
-        ),
-        Product(
-            id=str(uuid.uuid4()),
-            name="Mechanical Keyboard",
-            description="RGB backlit mechanical keyboard",
-            price=79.50,
-            stock_quantity=75,
-        ),
-        Product(
-            id=str(uuid.uuid4()),
-            name="USB-C Hub",
-            description="7-in-1 USB-C hub for laptops",
-            price=39.00,
-            stock_quantity=200,
-        ),
+        {
+            "name": "Wireless Mouse",
+            "description": "Ergonomic 2.4GHz wireless mouse",
+            "price": 24.99,
+            "stock_quantity": 120,
+        },
+        {
+            "name": "Mechanical Keyboard",
+            "description": "RGB backlit mechanical keyboard",
+            "price": 79.50,
+            "stock_quantity": 75,
+        },
+        {
+            "name": "USB-C Hub",
+            "description": "7-in-1 USB-C hub for laptops",
+            "price": 39.00,
+            "stock_quantity": 200,
+        },
     ]
-
-    db.add_all(sample_products)
-    db.commit()
+    # Stable ids let concurrent seeders collide on the primary key instead of
+    # inserting duplicate rows.
+    for sample_product in sample_products:
+        sample_product["id"] = str(uuid.uuid5(_SEED_NAMESPACE, sample_product["name"]))
+
+    insert = _INSERT_BY_DIALECT.get(db.bind.dialect.name)
+    if insert is None:
+        await db.execute(sa_insert(Product).values(sample_products))
+    else:
+        await db.execute(insert(Product).values(sample_products).on_conflict_do_nothing())
+    await db.commit()
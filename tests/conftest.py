@@ -5,20 +5,36 @@ from fastapi.testclient import TestClient
 from src.config import Settings
 from src.main import create_app
 from src.models.product import Product
+from src.services.cache_service import ProductCacheService
 
 
 @pytest.fixture
-def test_client(tmp_path):
+def redis_client():
+    return fakeredis.FakeAsyncRedis(decode_responses=False)
+
+
+@pytest.fixture
+def product_cache_service(redis_client):
+    settings = Settings(
+        api_port=8080,
+        redis_host="localhost",
+        redis_port=6379,
+        cache_ttl_seconds=120,
+    )
+    return ProductCacheService(settings, redis_client)
+
+
+@pytest.fixture
+def test_client(tmp_path, product_cache_service):
     db_file = tmp_path / "test.db"
     settings = Settings(
         api_port=8080,
         redis_host="localhost",
         redis_port=6379,
         cache_ttl_seconds=120,
-        database_url=f"sqlite:///{db_file}",
+        database_url=f"sqlite+aiosqlite:///{db_file}",
     )
-    fake_redis = fakeredis.FakeRedis(decode_responses=True)
-    app = create_app(settings=settings, redis_client=fake_redis)
+    app = create_app(settings=settings, cache_service=product_cache_service)
     with TestClient(app) as client:
         yield client
 
@@ -26,13 +42,13 @@ def test_client(tmp_path):
 @pytest.fixture
 def test_client_with_broken_redis(tmp_path):
     class BrokenRedis:
-        def get(self, *_args, **_kwargs):
+        async def get(self, *_args, **_kwargs):
             raise RuntimeError("redis down")
 
-        def set(self, *_args, **_kwargs):
+        async def setex(self, *_args, **_kwargs):
             raise RuntimeError("redis down")
 
-        def delete(self, *_args, **_kwargs):
+        async def delete(self, *_args, **_kwargs):
             raise RuntimeError("redis down")
 
     db_file = tmp_path / "test_broken.db"
@@ -41,7 +57,7 @@ def test_client_with_broken_redis(tmp_path):
         redis_host="localhost",
         redis_port=6379,
         cache_ttl_seconds=120,
-        database_url=f"sqlite:///{db_file}",
+        database_url=f"sqlite+aiosqlite:///{db_file}",
     )
     app = create_app(settings=settings, redis_client=BrokenRedis())
     with TestClient(app) as client:
@@ -0,0 +1,76 @@
+import asyncio
+
+from src.schemas.product import ProductResponse
+
+
+def _product(product_id: str) -> ProductResponse:
+    return ProductResponse(
+        id=product_id,
+        name=f"Product {product_id}",
+        description="Cached product",
+        price=5.5,
+        stock_quantity=3,
+    )
+
+
+def test_batch_get_returns_hits_and_misses_in_request_order(product_cache_service):
+    async def scenario():
+        await product_cache_service.set_product_in_cache(_product("a"))
+        await product_cache_service.set_product_in_cache(_product("c"))
+        return await product_cache_service.get_products_from_cache(["a", "b", "c"])
+
+    cached = asyncio.run(scenario())
+
+    assert [product.id if product else None for product in cached] == ["a", None, "c"]
+    assert cached[0].price == 5.5
+
+
+def test_batch_invalidate_removes_all_keys(product_cache_service):
+    async def scenario():
+        await product_cache_service.set_product_in_cache(_product("a"))
+        await product_cache_service.set_product_in_cache(_product("b"))
+        await product_cache_service.invalidate_products_cache(["a", "b"])
+        return await product_cache_service.get_products_from_cache(["a", "b"])
+
+    assert asyncio.run(scenario()) == [None, None]
+
+
+def test_local_layer_serves_hits_until_invalidated(redis_client, product_cache_service):
+    async def scenario():
+        await product_cache_service.set_product_in_cache(_product("a"))
+        await redis_client.flushall()
+
+        served_locally = await product_cache_service.get_product_from_cache("a")
+        await product_cache_service.invalidate_product_cache("a")
+        return served_locally, await product_cache_service.get_product_from_cache("a")
+
+    served_locally, after_invalidation = asyncio.run(scenario())
+
+    assert served_locally is not None and served_locally.id == "a"
+    assert after_invalidation is None
+
+
+def test_corrupt_entry_is_a_miss_without_dropping_other_batch_hits(redis_client, product_cache_service):
+    async def scenario():
+        await product_cache_service.set_product_in_cache(_product("a"))
+        await redis_client.set(b"product:bad", b"\xc1")
+        return await product_cache_service.get_products_from_cache(["a", "bad"])
+
+    cached = asyncio.run(scenario())
+
+    assert cached[0] is not None and cached[0].id == "a"
+    assert cached[1] is None
+
+
+def test_leftover_json_entry_is_a_miss_on_single_and_batch_reads(redis_client, product_cache_service):
+    async def scenario():
+        await redis_client.set(b"product:x", _product("x").model_dump_json().encode())
+        return (
+            await product_cache_service.get_product_from_cache("x"),
+            await product_cache_service.get_products_from_cache(["x"]),
+        )
+
+    single, batch = asyncio.run(scenario())
+
+    assert single is None
+    assert batch == [None]
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import ForeignKey, exc
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.database import Base
+from src.models.product import Product
+from src.schemas.product import ProductCreate, ProductUpdate
+from src.services.product_repository import create_product, update_product
+
+
+class _LazyLoadProbe(Base):
+    # Throwaway relationship target: Product has none yet, so without one the
+    # raiseload guard has nothing to act on.
+    __tablename__ = "lazy_load_probes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    product_id: Mapped[str] = mapped_column(ForeignKey("products.id"))
+
+
+Product.lazy_load_probes = relationship(_LazyLoadProbe)
+
+
+def test_update_product_raises_instead_of_lazy_loading(test_client):
+    session_factory = test_client.app.state.session_factory
+
+    async def scenario():
+        async with session_factory() as db:
+            created = await create_product(
+                db,
+                ProductCreate(name="Guarded", description="No lazy loads", price=3.5, stock_quantity=2),
+            )
+        async with session_factory() as db:
+            updated = await update_product(db, created.id, ProductUpdate(price=4.5))
+            with pytest.raises(exc.InvalidRequestError, match="lazy='raise'"):
+                _ = updated.lazy_load_probes
+            return updated
+
+    updated = test_client.portal.call(scenario)
+
+    assert updated.price == 4.5
@@ -22,10 +22,14 @@ def test_get_product_cache_miss_then_hit(test_client, seeded_product_id):
     assert first_response.status_code == 200
 
     session_factory = test_client.app.state.session_factory
-    with session_factory() as db:
-        product = db.get(Product, seeded_product_id)
-        db.delete(product)
-        db.commit()
+
+    async def _delete_directly_from_db():
+        async with session_factory() as db:
+            product = await db.get(Product, seeded_product_id)
+            await db.delete(product)
+            await db.commit()
+
+    test_client.portal.call(_delete_directly_from_db)
 
     second_response = test_client.get(f"/products/{seeded_product_id}")
     assert second_response.status_code == 200
@@ -58,6 +62,14 @@ def test_delete_invalidates_cache_and_get_returns_404(test_client, seeded_produc
     assert get_after_delete.status_code == 404
 
 
+def test_put_and_delete_unknown_product_return_404(test_client):
+    update_response = test_client.put("/products/does-not-exist", json={"price": 5.0})
+    assert update_response.status_code == 404
+
+    delete_response = test_client.delete("/products/does-not-exist")
+    assert delete_response.status_code == 404
+
+
 def test_input_validation_for_post_and_put(test_client):
     bad_post = test_client.post(
         "/products",
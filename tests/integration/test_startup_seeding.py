@@ -1,51 +1,76 @@
-import fakeredis
+import asyncio
+
 from fastapi.testclient import TestClient
 from sqlalchemy import func, select
 
 from src.config import Settings
 from src.main import create_app
 from src.models.product import Product
+from src.seed import run_seed
 
 
-def _product_count(app) -> int:
+async def _product_count(app) -> int:
     session_factory = app.state.session_factory
-    with session_factory() as db:
-        return db.execute(select(func.count(Product.id))).scalar_one()
+    async with session_factory() as db:
+        return (await db.execute(select(func.count(Product.id)))).scalar_one()
 
 
-def test_startup_seeds_products_when_database_is_empty(tmp_path):
+def test_startup_seeds_products_when_database_is_empty(tmp_path, product_cache_service):
     db_file = tmp_path / "seeded.db"
     settings = Settings(
         api_port=8080,
         redis_host="localhost",
         redis_port=6379,
         cache_ttl_seconds=120,
-        database_url=f"sqlite:///{db_file}",
+        database_url=f"sqlite+aiosqlite:///{db_file}",
+        seed_on_startup=True,
     )
 
-    app = create_app(settings=settings, redis_client=fakeredis.FakeRedis(decode_responses=True))
-    with TestClient(app):
-        seeded_count = _product_count(app)
+    app = create_app(settings=settings, cache_service=product_cache_service)
+    with TestClient(app) as client:
+        seeded_count = client.portal.call(_product_count, app)
 
     assert 3 <= seeded_count <= 5
 
 
-def test_startup_does_not_duplicate_seed_data(tmp_path):
+def test_startup_does_not_duplicate_seed_data(tmp_path, product_cache_service):
     db_file = tmp_path / "seeded_once.db"
     settings = Settings(
         api_port=8080,
         redis_host="localhost",
         redis_port=6379,
         cache_ttl_seconds=120,
-        database_url=f"sqlite:///{db_file}",
+        database_url=f"sqlite+aiosqlite:///{db_file}",
+        seed_on_startup=True,
     )
 
-    first_app = create_app(settings=settings, redis_client=fakeredis.FakeRedis(decode_responses=True))
-    with TestClient(first_app):
-        first_count = _product_count(first_app)
+    first_app = create_app(settings=settings, cache_service=product_cache_service)
+    with TestClient(first_app) as client:
+        first_count = client.portal.call(_product_count, first_app)
 
-    second_app = create_app(settings=settings, redis_client=fakeredis.FakeRedis(decode_responses=True))
-    with TestClient(second_app):
-        second_count = _product_count(second_app)
+    second_app = create_app(settings=settings, cache_service=product_cache_service)
+    with TestClient(second_app) as client:
+        second_count = client.portal.call(_product_count, second_app)
 
     assert first_count == second_count
+
+
+def test_startup_skips_seeding_unless_enabled(tmp_path, product_cache_service):
+    db_file = tmp_path / "unseeded.db"
+    settings = Settings(
+        api_port=8080,
+        redis_host="localhost",
+        redis_port=6379,
+        cache_ttl_seconds=120,
+        database_url=f"sqlite+aiosqlite:///{db_file}",
+    )
+
+    app = create_app(settings=settings, cache_service=product_cache_service)
+    with TestClient(app) as client:
+        assert client.portal.call(_product_count, app) == 0
+
+    asyncio.run(run_seed(settings))
+    asyncio.run(run_seed(settings))
+
+    with TestClient(app) as client:
+        assert client.portal.call(_product_count, app) == 3